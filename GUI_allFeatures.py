@@ -1,16 +1,45 @@
 #!/usr/bin/env python3
+import time
+STARTUP_T0 = time.perf_counter()  # reference for --profile-startup, taken before the heavy imports
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+import tkinter.font as tkfont
+import bisect
+import re
+import math
 import threading
 import queue
-import time
-import serial
-import serial.tools.list_ports as list_ports
 
 # ---- Settings ----
 BAUD = 9600
 MAX_LASER_FREQUENCY = 200.0  # Hz
 
+serial = None  # pyserial, imported by load_serial() to keep it off the startup path
+
+def load_serial():
+    """Import pyserial on first use (port scan / connect) and return the module"""
+    global serial
+    if serial is None:
+        import serial.tools.list_ports  # binds the global "serial"
+    return serial
+
+class StartupProfile:
+    """Stage-by-stage startup timings, measured from STARTUP_T0"""
+    def __init__(self):
+        self.stages = [("imports", time.perf_counter())]
+
+    def mark(self, stage):
+        self.stages.append((stage, time.perf_counter()))
+
+    def report(self):
+        lines = []
+        previous = STARTUP_T0
+        for stage, t in self.stages:
+            lines.append(f"[STARTUP] {stage:<20} +{(t - previous) * 1000:7.1f} ms  ({(t - STARTUP_T0) * 1000:7.1f} ms total)")
+            previous = t
+        return lines
+
 class SerialReader(threading.Thread):
     def __init__(self, ser, outq, stop_event):
         super().__init__(daemon=True)
@@ -32,9 +61,108 @@ class SerialReader(threading.Thread):
                 self.outq.put(f"[ERROR] Serial exception: {e}")
                 break
 
-class PLDController(tk.Tk):
+# ---- Session Log ----
+SEV_INFO, SEV_WARN, SEV_ERROR = 0, 1, 2
+SEVERITY_NAMES = {SEV_INFO: "Info", SEV_WARN: "Warning", SEV_ERROR: "Error"}
+LOG_KINDS = ("ERROR", "WARN", "STATE", "OK", "SENT", "EXPERIMENT", "INFO")
+LOG_TIME_WINDOWS = {"All": None, "Last 1 min": 60, "Last 10 min": 600, "Last 1 h": 3600}
+
+def classify_line(line):
+    """Return (kind, severity) of a log line"""
+    if "❌" in line or "[ERROR]" in line or "[EXPERIMENT ERROR]" in line:
+        return "ERROR", SEV_ERROR
+    if "⚠️" in line or "[WARN]" in line or "Warnung" in line:
+        return "WARN", SEV_WARN
+    if line.startswith("SYSTEM_STATE:"):
+        return "STATE", SEV_INFO
+    if line.startswith("> "):
+        return "SENT", SEV_INFO
+    if line.startswith("[EXPERIMENT]"):
+        return "EXPERIMENT", SEV_INFO
+    if "OK:" in line or "✅" in line:
+        return "OK", SEV_INFO
+    return "INFO", SEV_INFO
+
+class SessionLog:
+    """Append-only store of all log lines with an index by kind, severity and time"""
     def __init__(self):
+        self.lines = []
+        self.lines_lower = []
+        self.times = []
+        self.kinds = []
+        self.severities = []
+        self.by_kind = {kind: [] for kind in LOG_KINDS}
+        self.by_severity = {sev: [] for sev in SEVERITY_NAMES}
+        self._last_query = None
+        self._last_result = []
+        self._last_scanned = 0
+        self._lock = threading.Lock()  # log_line is also called from the experiment thread
+
+    def __len__(self):
+        return len(self.lines)
+
+    def append(self, line):
+        kind, severity = classify_line(line)
+        with self._lock:
+            idx = len(self.lines)
+            self.lines.append(line)
+            self.lines_lower.append(line.lower())
+            self.times.append(time.time())
+            self.kinds.append(kind)
+            self.severities.append(severity)
+            self.by_kind[kind].append(idx)
+            self.by_severity[severity].append(idx)
+        return idx
+
+    def _candidates(self, kind, min_severity, start):
+        """Indices >= start that match kind and severity, in ascending order"""
+        if kind:
+            ids = self.by_kind[kind]
+            ids = ids[bisect.bisect_left(ids, start):]
+            if min_severity > SEV_INFO:
+                ids = [i for i in ids if self.severities[i] >= min_severity]
+            return ids
+        if min_severity > SEV_INFO:
+            ids = []
+            for sev in range(min_severity, SEV_ERROR + 1):
+                sev_ids = self.by_severity[sev]
+                ids.extend(sev_ids[bisect.bisect_left(sev_ids, start):])
+            ids.sort()
+            return ids
+        return range(start, len(self.lines))
+
+    def query(self, text="", kind=None, min_severity=SEV_INFO, since=None):
+        """Return indices of lines matching all filters (case-insensitive text search).
+
+        Results are cached: narrowing the search text or appending new lines only
+        scans the previous result set and the newly added lines.
+        """
+        text = text.lower()
+        with self._lock:
+            start = 0 if since is None else bisect.bisect_left(self.times, since)
+            last = self._last_query
+            if last and last[1:] == (kind, min_severity) and text.startswith(last[0]):
+                if text != last[0]:
+                    self._last_result = [i for i in self._last_result if text in self.lines_lower[i]]
+                new = self._candidates(kind, min_severity, self._last_scanned)
+            else:
+                self._last_result = []
+                new = self._candidates(kind, min_severity, 0)
+            if text:
+                new = [i for i in new if text in self.lines_lower[i]]
+            self._last_result.extend(new)
+            self._last_query = (text, kind, min_severity)
+            self._last_scanned = len(self.lines)
+
+        # Return a copy - the cached list is extended in place by the next query
+        return self._last_result[bisect.bisect_left(self._last_result, start):]
+
+class PLDController(tk.Tk):
+    def __init__(self, profile_startup=False):
+        self.startup = StartupProfile()
+        self.profile_startup = profile_startup
         super().__init__()
+        self.startup.mark("tk init")
         self.title("PLD Controller - All Features")
         self.geometry("800x600")
         
@@ -54,11 +182,59 @@ class PLDController(tk.Tk):
         self.outq = queue.Queue()
 
         self.saved_positions_cache = {1: 0, 2: 267, 3: 533, 4: 800, 5: 1067, 6: 1333}  # Default Positionen
-        
+
+        # Results of repeated TEACH runs ("TEACH ist fertig! Dauer: <ms> ms, Abweichung: <steps> Schritte")
+        self.teach_durations = []
+        self.teach_offsets = []
+
+        # Session log (append-only) and state of the visible log window
+        self.session_log = SessionLog()
+        self.log_rows = []          # indices of lines matching the current filter
+        self.log_top = 0            # first visible row
+        self.log_rendered_rows = None  # rows currently shown in the Text widget
+        self.log_follow = True      # stick to the newest line
+        self.log_clear_mark = 0     # lines before this index are hidden by "Clear Log"
+        self.log_dirty = False
+        self.log_filter_job = None
+        self.log_refreshed_at = 0.0 # "Last N min" filters are re-evaluated at least once per second
+
+        # Port scan runs in the background, see refresh_ports
+        self.port_scan_result = None
+        self.port_scan_error = None
+        self.port_scan_running = False
+        self.startup_reported = False
+
         self._build_ui()
+        self.startup.mark("core ui built")
         self.refresh_ports()
+        self.bind("<Map>", self._on_first_map)
         self.after(20, self.drain_queue)
 
+    def _on_first_map(self, event):
+        """Build the rarely used panels once the main window is on screen"""
+        if event.widget is not self:
+            return
+        self.unbind("<Map>")
+        # Idle handlers run in order, so this one runs after the redraw queued by the map
+        self.after_idle(self._on_first_paint)
+
+    def _on_first_paint(self):
+        self.startup.mark("first paint")
+        self._build_deferred_ui()
+        self.startup.mark("deferred ui built")
+        self._finish_startup_profile()
+
+    def _finish_startup_profile(self):
+        """Report the startup timings once the window is painted and the ports are known"""
+        stages = [stage for stage, t in self.startup.stages]
+        if self.startup_reported or "deferred ui built" not in stages or "ports enumerated" not in stages:
+            return
+        self.startup_reported = True
+        if self.profile_startup:
+            for line in self.startup.report():
+                print(line)
+                self.log_line(line)
+
     def _build_ui(self):
         # Main container with scrollbar
         main_frame = ttk.Frame(self)
@@ -80,6 +256,9 @@ class PLDController(tk.Tk):
         status_frame = ttk.LabelFrame(main_frame, text="System Status")
         status_frame.pack(fill="x", pady=(0, 10))
         
+        self.teach_stats_var = tk.StringVar(value="Teach: no runs yet")
+        ttk.Label(status_frame, textvariable=self.teach_stats_var).pack(side="bottom", anchor="w", padx=5, pady=(0, 5))
+
         self.status_var = tk.StringVar(value="Disconnected")
         ttk.Label(status_frame, textvariable=self.status_var).pack(side="left", padx=5, pady=5)
         
@@ -109,23 +288,9 @@ class PLDController(tk.Tk):
         
         ttk.Button(pos_frame, text="Save Current", command=self.save_position).grid(row=1, column=4, padx=10, pady=5)
 
-        # === MOTOR SETTINGS ===
-        motor_frame = ttk.LabelFrame(main_frame, text="Motor Settings")
-        motor_frame.pack(fill="x", pady=(0, 10))
-
-        # Max Speed
-        ttk.Label(motor_frame, text="Max Speed:").grid(row=0, column=0, padx=5, pady=5)
-        self.maxspeed_var = tk.DoubleVar(value=500.0)
-        ttk.Entry(motor_frame, width=8, textvariable=self.maxspeed_var).grid(row=0, column=1, padx=2, pady=5)
-        ttk.Button(motor_frame, text="Set", 
-                command=lambda: self.send(f"CMD:SETMAXSPEED:{self.maxspeed_var.get()}")).grid(row=0, column=2, padx=2, pady=5)
-
-        # Acceleration
-        ttk.Label(motor_frame, text="Acceleration:").grid(row=0, column=3, padx=5, pady=5)
-        self.accel_var = tk.DoubleVar(value=500.0)
-        ttk.Entry(motor_frame, width=8, textvariable=self.accel_var).grid(row=0, column=4, padx=2, pady=5)
-        ttk.Button(motor_frame, text="Set", 
-                command=lambda: self.send(f"CMD:SETACCEL:{self.accel_var.get()}")).grid(row=0, column=5, padx=2, pady=5)
+        # === MOTOR SETTINGS === (content built after first paint)
+        self.motor_frame = ttk.LabelFrame(main_frame, text="Motor Settings")
+        self.motor_frame.pack(fill="x", pady=(0, 10))
 
         # === LASER CONTROL ===
         laser_frame = ttk.LabelFrame(main_frame, text="Laser Control")
@@ -185,36 +350,95 @@ class PLDController(tk.Tk):
         self.progress_var = tk.StringVar(value="Ready")
         ttk.Label(exp_frame, textvariable=self.progress_var).grid(row=3, column=0, columnspan=6, pady=5)
 
-        # === CUSTOM COMMAND ===
-        cmd_frame = ttk.LabelFrame(main_frame, text="Custom Command")
-        cmd_frame.pack(fill="x", pady=(0, 10))
-        
-        self.cmd_var = tk.StringVar()
-        cmd_entry = ttk.Entry(cmd_frame, textvariable=self.cmd_var)
-        cmd_entry.pack(side="left", fill="x", expand=True, padx=5, pady=5)
-        cmd_entry.bind('<Return>', lambda e: self.send_command())
-        
-        ttk.Button(cmd_frame, text="Send", command=self.send_command).pack(side="left", padx=5, pady=5)
+        # === CUSTOM COMMAND === (content built after first paint)
+        self.cmd_frame = ttk.LabelFrame(main_frame, text="Custom Command")
+        self.cmd_frame.pack(fill="x", pady=(0, 10))
 
         # === COMMUNICATION LOG ===
         log_frame = ttk.LabelFrame(main_frame, text="Communication Log (Arduino Output)")
         log_frame.pack(fill="both", expand=True)
-        
-        # Text widget with scrollbars
+
+        # Search / filter controls
+        filter_frame = ttk.Frame(log_frame)
+        filter_frame.pack(fill="x", padx=5, pady=(5, 0))
+
+        ttk.Label(filter_frame, text="Search:").pack(side="left")
+        self.log_search_var = tk.StringVar()
+        ttk.Entry(filter_frame, width=20, textvariable=self.log_search_var).pack(side="left", padx=(2, 8))
+
+        ttk.Label(filter_frame, text="Type:").pack(side="left")
+        self.log_kind_var = tk.StringVar(value="All")
+        ttk.Combobox(filter_frame, width=11, textvariable=self.log_kind_var,
+                     values=["All", *LOG_KINDS], state="readonly").pack(side="left", padx=(2, 8))
+
+        ttk.Label(filter_frame, text="Severity:").pack(side="left")
+        self.log_severity_var = tk.StringVar(value=SEVERITY_NAMES[SEV_INFO])
+        ttk.Combobox(filter_frame, width=8, textvariable=self.log_severity_var,
+                     values=list(SEVERITY_NAMES.values()), state="readonly").pack(side="left", padx=(2, 8))
+
+        ttk.Label(filter_frame, text="Time:").pack(side="left")
+        self.log_window_var = tk.StringVar(value="All")
+        ttk.Combobox(filter_frame, width=10, textvariable=self.log_window_var,
+                     values=list(LOG_TIME_WINDOWS), state="readonly").pack(side="left", padx=(2, 8))
+
+        self.log_match_var = tk.StringVar(value="")
+        ttk.Label(filter_frame, textvariable=self.log_match_var).pack(side="right")
+
+        for var in (self.log_search_var, self.log_kind_var, self.log_severity_var, self.log_window_var):
+            var.trace_add("write", self._on_log_filter_changed)
+
+        # Text widget with scrollbars - only the visible window of the session log is rendered
         text_frame = ttk.Frame(log_frame)
         text_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        self.log_text = tk.Text(text_frame, wrap="word", height=12, state="disabled")
-        v_scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.log_text.yview)
+
+        self.log_text = tk.Text(text_frame, wrap="none", height=12, state="disabled")
+        self.log_text.tag_configure("ERROR", foreground="red")
+        self.log_text.tag_configure("WARN", foreground="darkorange")
+        self.log_vscroll = ttk.Scrollbar(text_frame, orient="vertical", command=self._on_log_scroll)
         h_scrollbar = ttk.Scrollbar(text_frame, orient="horizontal", command=self.log_text.xview)
-        self.log_text.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        self.log_text.pack(side="left", fill="both", expand=True)
-        v_scrollbar.pack(side="right", fill="y")
+        self.log_text.configure(xscrollcommand=h_scrollbar.set)
+        self.log_line_height = tkfont.Font(font=self.log_text.cget("font")).metrics("linespace")
+
+        self.log_text.bind("<Configure>", lambda e: self._render_log())
+        self.log_text.bind("<MouseWheel>", lambda e: self._scroll_log(-1 if e.delta > 0 else 1, "units"))
+        self.log_text.bind("<Button-4>", lambda e: self._scroll_log(-1, "units"))
+        self.log_text.bind("<Button-5>", lambda e: self._scroll_log(1, "units"))
+
         h_scrollbar.pack(side="bottom", fill="x")
-        
+        self.log_text.pack(side="left", fill="both", expand=True)
+        self.log_vscroll.pack(side="right", fill="y")
+
         ttk.Button(log_frame, text="Clear Log", command=self.clear_log).pack(anchor="e", padx=5, pady=5)
 
+    def _build_deferred_ui(self):
+        """Fill the panels that are not needed for the first paint"""
+        # === MOTOR SETTINGS ===
+        motor_frame = self.motor_frame
+
+        # Max Speed
+        ttk.Label(motor_frame, text="Max Speed:").grid(row=0, column=0, padx=5, pady=5)
+        self.maxspeed_var = tk.DoubleVar(value=500.0)
+        ttk.Entry(motor_frame, width=8, textvariable=self.maxspeed_var).grid(row=0, column=1, padx=2, pady=5)
+        ttk.Button(motor_frame, text="Set", 
+                command=lambda: self.send(f"CMD:SETMAXSPEED:{self.maxspeed_var.get()}")).grid(row=0, column=2, padx=2, pady=5)
+
+        # Acceleration
+        ttk.Label(motor_frame, text="Acceleration:").grid(row=0, column=3, padx=5, pady=5)
+        self.accel_var = tk.DoubleVar(value=500.0)
+        ttk.Entry(motor_frame, width=8, textvariable=self.accel_var).grid(row=0, column=4, padx=2, pady=5)
+        ttk.Button(motor_frame, text="Set", 
+                command=lambda: self.send(f"CMD:SETACCEL:{self.accel_var.get()}")).grid(row=0, column=5, padx=2, pady=5)
+
+        # === CUSTOM COMMAND ===
+        cmd_frame = self.cmd_frame
+        
+        self.cmd_var = tk.StringVar()
+        cmd_entry = ttk.Entry(cmd_frame, textvariable=self.cmd_var)
+        cmd_entry.pack(side="left", fill="x", expand=True, padx=5, pady=5)
+        cmd_entry.bind('<Return>', lambda e: self.send_command())
+        
+        ttk.Button(cmd_frame, text="Send", command=self.send_command).pack(side="left", padx=5, pady=5)
+
     def create_position_config(self):
         """Create position configuration rows"""
         # Clear existing widgets
@@ -256,10 +480,38 @@ class PLDController(tk.Tk):
 
     # === SERIAL METHODS ===
     def refresh_ports(self):
-        ports = [f"{p.device} - {p.description}" for p in list_ports.comports()]
+        """Enumerate serial ports in a background thread (slow on some PCs)"""
+        if self.port_scan_running:
+            return
+        self.port_scan_running = True
+        self.port_scan_result = None
+        self.port_cmb['values'] = ["Searching ports..."]
+        self.port_cmb.current(0)
+        threading.Thread(target=self._scan_ports, daemon=True).start()
+        self.after(50, self._poll_port_scan)
+
+    def _scan_ports(self):
+        try:
+            ports = load_serial().tools.list_ports.comports()
+            self.port_scan_result = [f"{p.device} - {p.description}" for p in ports]
+        except Exception as e:
+            self.port_scan_error = e
+            self.port_scan_result = []
+
+    def _poll_port_scan(self):
+        ports = self.port_scan_result
+        if ports is None:
+            self.after(50, self._poll_port_scan)
+            return
+        self.port_scan_running = False
+        if self.port_scan_error:
+            self.log_line(f"[ERROR] Port scan failed: {self.port_scan_error}")
+            self.port_scan_error = None
         self.port_cmb['values'] = ports if ports else ["No ports found"]
-        if ports:
-            self.port_cmb.current(0)
+        self.port_cmb.current(0)
+        if not self.startup_reported:
+            self.startup.mark("ports enumerated")
+            self._finish_startup_profile()
 
     def toggle_connect(self):
         if self.ser and self.ser.is_open:
@@ -269,9 +521,15 @@ class PLDController(tk.Tk):
 
     def connect(self):
         port = self.port_cmb.get().split(" - ")[0]
-        if not port:
+        if not port or port in ("Searching ports...", "No ports found"):
             messagebox.showwarning("No Port", "Please select a port")
             return
+
+        try:
+            load_serial()
+        except ImportError as e:
+            messagebox.showerror("Connection Error", f"pyserial is not available: {e}")
+            return
             
         try:
             self.ser = serial.Serial(port, BAUD, timeout=1)
@@ -323,6 +581,9 @@ class PLDController(tk.Tk):
         try:
             self.ser.write((command + "\n").encode())
             self.log_line(f"> {command}")
+            if command.strip() == "CMD:TEACH":
+                self.teach_done = False  # Firmware setzt teachDone beim Start des TEACH zurück
+                self.status_var.set("Connected - Teach running")
         except serial.SerialException as e:
             self.log_line(f"[ERROR] Send failed: {e}")
 
@@ -439,7 +700,7 @@ class PLDController(tk.Tk):
             return
             
         if not self.teach_done:
-            messagebox.showwarning("Teach Required", "Teach not done."):
+            messagebox.showwarning("Teach Required", "Teach not done.")
             return
         
         cycles = self.cycles_var.get()
@@ -621,11 +882,9 @@ class PLDController(tk.Tk):
 
     # === LOG METHODS ===
     def log_line(self, line: str):
-        """Add line to log (thread-safe)"""
-        self.log_text.config(state="normal")
-        self.log_text.insert("end", line + "\n")
-        self.log_text.see("end")
-        self.log_text.config(state="disabled")
+        """Add line to log (thread-safe, rendered by drain_queue)"""
+        self.session_log.append(line)
+        self.log_dirty = True
 
         # Statemachine Signale
         if "OK:TEACH" in line or "TEACH IST FERTIG" in line.upper():
@@ -647,7 +906,9 @@ class PLDController(tk.Tk):
         if "teach ist fertig" in line_lower or "teachdone: 1" in line_lower:
             self.teach_done = True
             self.status_var.set("Connected - Teach Done")
-        elif "teach zurückgesetzt" in line_lower or "teachdone: 0" in line_lower:
+            self.record_teach_result(line_lower)
+        elif ("teach zurückgesetzt" in line_lower or "teachdone: 0" in line_lower
+              or "teach abgebrochen" in line_lower or "teach unterbrochen" in line_lower):
             self.teach_done = False
             self.status_var.set("Connected - Teach Required")
   
@@ -680,10 +941,122 @@ class PLDController(tk.Tk):
             self.manual_mode = False
             self.status_var.set("Connected - Auto Mode")
 
+    def record_teach_result(self, line_lower):
+        """Collect homing time and zero-point offset of a TEACH run and update the statistic"""
+        duration = re.search(r"dauer:\s*(\d+)\s*ms", line_lower)
+        if not duration:
+            return
+        self.teach_durations.append(int(duration.group(1)) / 1000.0)
+        offset = re.search(r"abweichung:\s*(-?\d+)", line_lower)
+        if offset:
+            self.teach_offsets.append(int(offset.group(1)))
+
+        stats = (f"Teach: n={len(self.teach_durations)}, last {self.teach_durations[-1]:.2f} s, "
+                 f"mean {sum(self.teach_durations) / len(self.teach_durations):.2f} s")
+        if len(self.teach_offsets) >= 2:
+            # Computed by hand - importing the statistics module costs ~5 ms at startup
+            n = len(self.teach_offsets)
+            mean = sum(self.teach_offsets) / n
+            std = math.sqrt(sum((o - mean) ** 2 for o in self.teach_offsets) / (n - 1))
+            stats += (f" | Zero offset: mean {mean:+.1f}, "
+                      f"std {std:.1f}, "
+                      f"max |{max(abs(o) for o in self.teach_offsets)}| steps")
+        elif self.teach_offsets:
+            stats += f" | Zero offset: {self.teach_offsets[0]:+d} steps"
+        self.teach_stats_var.set(stats)
+
     def clear_log(self):
+        """Hide all lines logged so far - the session log itself stays searchable"""
+        self.log_clear_mark = len(self.session_log)
+        self.log_follow = True
+        self._refresh_log_rows()
+        self._render_log()
+
+    def _log_filter_active(self):
+        return (self.log_search_var.get() != "" or self.log_kind_var.get() != "All"
+                or self.log_severity_var.get() != SEVERITY_NAMES[SEV_INFO]
+                or self.log_window_var.get() != "All")
+
+    def _refresh_log_rows(self):
+        """Recompute the rows matching the current search and filters"""
+        self.log_refreshed_at = time.time()
+        if not self._log_filter_active():
+            self.log_rows = range(self.log_clear_mark, len(self.session_log))
+            self.log_match_var.set(f"{len(self.log_rows)} lines")
+            return
+
+        kind = self.log_kind_var.get()
+        severity = {name: sev for sev, name in SEVERITY_NAMES.items()}[self.log_severity_var.get()]
+        window = LOG_TIME_WINDOWS[self.log_window_var.get()]
+        self.log_rows = self.session_log.query(
+            self.log_search_var.get(),
+            kind=None if kind == "All" else kind,
+            min_severity=severity,
+            since=None if window is None else time.time() - window,
+        )
+        self.log_match_var.set(f"{len(self.log_rows)} of {len(self.session_log)} lines")
+
+    def _on_log_filter_changed(self, *args):
+        """Re-filter shortly after the last keystroke (incremental search)"""
+        if self.log_filter_job:
+            self.after_cancel(self.log_filter_job)
+        self.log_filter_job = self.after(100, self._apply_log_filter)
+
+    def _apply_log_filter(self):
+        self.log_filter_job = None
+        self.log_follow = True
+        self._refresh_log_rows()
+        self._render_log()
+
+    def _visible_log_lines(self):
+        insets = 2 * sum(int(self.log_text.cget(opt)) for opt in ("borderwidth", "highlightthickness", "pady"))
+        return max(1, (self.log_text.winfo_height() - insets) // self.log_line_height)
+
+    def _render_log(self):
+        """Render only the rows that fit into the log widget"""
+        total = len(self.log_rows)
+        height = self._visible_log_lines()
+        if self.log_follow:
+            self.log_top = max(0, total - height)
+        self.log_top = min(max(0, self.log_top), max(0, total - height))
+        visible = list(self.log_rows[self.log_top:self.log_top + height])
+
+        if total:
+            self.log_vscroll.set(self.log_top / total, (self.log_top + len(visible)) / total)
+        else:
+            self.log_vscroll.set(0, 1)
+
+        # Keep the widget (and the user's selection) untouched unless the rows in view change
+        if visible == self.log_rendered_rows:
+            return
+        self.log_rendered_rows = visible
+
+        xview = self.log_text.xview()[0]
         self.log_text.config(state="normal")
         self.log_text.delete(1.0, "end")
+        lines, kinds = self.session_log.lines, self.session_log.kinds
+        for i in visible:
+            self.log_text.insert("end", lines[i] + "\n", kinds[i])
         self.log_text.config(state="disabled")
+        self.log_text.xview_moveto(xview)
+        if self.log_follow and visible:
+            self.log_text.see(f"{len(visible)}.0")  # never clip the newest line
+
+    def _on_log_scroll(self, action, amount, unit=None):
+        """Scrollbar callback ("moveto" fraction or "scroll" n units/pages)"""
+        if action == "moveto":
+            self.log_top = int(float(amount) * len(self.log_rows))
+            self.log_follow = self.log_top >= len(self.log_rows) - self._visible_log_lines()
+            self._render_log()
+        else:
+            self._scroll_log(int(amount), unit)
+
+    def _scroll_log(self, amount, unit):
+        height = self._visible_log_lines()
+        self.log_top += amount * (height if unit == "pages" else 1)
+        self.log_follow = self.log_top >= len(self.log_rows) - height
+        self._render_log()
+        return "break"
 
     def drain_queue(self):
         """Process messages from serial reader"""
@@ -693,6 +1066,12 @@ class PLDController(tk.Tk):
                 self.log_line(line)
         except queue.Empty:
             pass
+        if self.log_window_var.get() != "All" and time.time() - self.log_refreshed_at > 1.0:
+            self.log_dirty = True  # let old lines drop out of the time window on a quiet link
+        if self.log_dirty:
+            self.log_dirty = False
+            self._refresh_log_rows()
+            self._render_log()
         self.after(20, self.drain_queue)
 
     def on_closing(self):
@@ -704,6 +1083,6 @@ class PLDController(tk.Tk):
         self.destroy()
 
 if __name__ == "__main__":
-    app = PLDController()
+    app = PLDController(profile_startup="--profile-startup" in sys.argv[1:])
     app.protocol("WM_DELETE_WINDOW", app.on_closing)
     app.mainloop()
\ No newline at end of file
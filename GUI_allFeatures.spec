@@ -16,19 +16,18 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# onedir build: a onefile exe unpacks itself to a temp directory on every launch
+# and UPX-compressed DLLs have to be decompressed on load, both cost seconds at startup
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='PLD_Taretrotator',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -37,3 +36,12 @@ exe = EXE(
     entitlements_file=None,
     icon='multilayer.ico'
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='PLD_Taretrotator',
+)
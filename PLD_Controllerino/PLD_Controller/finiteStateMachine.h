@@ -9,6 +9,8 @@ enum SystemState
   SYS_TEACH_START,
   SYS_TEACH_RECHTS,
   SYS_TEACH_FREI,
+  SYS_TEACH_ZURUECK,
+  SYS_TEACH_FEIN,
   SYS_TEACH_DONE,
   SYS_MOVE_TO_POS,
   SYS_LASER_ACTIVE,
@@ -23,6 +25,8 @@ namespace finiteStateMachine
   void setState(SystemState newState);
   bool isTeachDone();
   void setTeachDone(bool done);
+  void invalidateZeroReference();
+  void startTeach();
   void printCurrentState();
 }
 
@@ -67,7 +67,7 @@ namespace readSerialCommand
   {
     if (cmd == "CMD:TEACH") 
     {
-      finiteStateMachine::setState(SYS_TEACH_START);
+      finiteStateMachine::startTeach();
     }
     else if (cmd.startsWith("CMD:SAVE")) 
     {
@@ -141,6 +141,7 @@ namespace readSerialCommand
     else if (cmd == "CMD:AUTO")
     {
       stepperControl::setCurrentPosition(0);
+      finiteStateMachine::invalidateZeroReference();
       stepperControl::enableDriver(true);
       Serial.println("✅ Automatischer Modus aktiviert. Treiber aktiviert.");
     }
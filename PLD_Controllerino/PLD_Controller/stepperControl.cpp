@@ -80,6 +80,30 @@ namespace stepperControl
   {
     stepper.stop();
   }
+
+  void stopNow()
+  {
+    // Sofort anhalten ohne Bremsrampe (setzt Ziel und Geschwindigkeit zurück)
+    stepper.setCurrentPosition(stepper.currentPosition());
+  }
+
+  long getCurrentPosition()
+  {
+    return stepper.currentPosition();
+  }
+
+  void applyMotionProfile(float speed, float accel)
+  {
+    // Temporär, ohne die Benutzerwerte zu ändern (z.B. für TEACH)
+    stepper.setMaxSpeed(speed);
+    stepper.setAcceleration(accel);
+  }
+
+  void restoreUserMotionProfile()
+  {
+    stepper.setMaxSpeed(userMaxSpeed);
+    stepper.setAcceleration(userAcceleration);
+  }
   
   void setCurrentPosition(long position) 
   {
@@ -115,6 +139,11 @@ namespace stepperControl
     }
   }
   
+  void resetMoveSource()
+  {
+    lastMove = MOVE_NONE;
+  }
+
   int getNormalizedPosition() 
   {
     long pos = stepper.currentPosition();
@@ -232,6 +261,11 @@ namespace stepperControl
     }
   }
 
+  void moveBy(long steps)
+  {
+    moveToRelative(stepper.currentPosition() + steps);
+  }
+
   void printStatus() 
   {
     Serial.print("TeachDone: "); 
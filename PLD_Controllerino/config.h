@@ -17,6 +17,19 @@
 const int MAX_STEP = 1600;
 const float DEFAULT_MAX_SPEED = 500.0;
 const float DEFAULT_ACCELERATION = 500.0;
+
+// TEACH: schnelle Suche, kurz zurück, langsame Feinsuche der Lichtschranke
+const float TEACH_FAST_SPEED = 1500.0;
+const float TEACH_SLOW_SPEED = 100.0;
+const float TEACH_ACCELERATION = 3000.0;
+const long TEACH_SEARCH_STEPS = 5000;       // max. Weg der schnellen Suche
+const long TEACH_BACKOFF_STEPS = 40;        // Rückweg vor der Feinsuche
+const int TEACH_MAX_BACKOFFS = 5;           // max. Rückwege bis Lichtschranke frei
+const unsigned long TEACH_DEBOUNCE_MS = 10; // Lichtschranke muss so lange HIGH sein
+// Der alte TEACH setzte den Nullpunkt nach 50 ms HIGH bei 500 Schritte/s, ca. 25 Schritte
+// hinter der Kante. Die Feinsuche stoppt ca. 1 Schritt dahinter (10 ms bei 100 Schritte/s).
+// Der Nullpunkt wird um die Differenz verschoben, damit gespeicherte Positionen gültig bleiben.
+const long TEACH_ZERO_OFFSET = 24;
 extern float userMaxSpeed;
 extern float userAcceleration;
 
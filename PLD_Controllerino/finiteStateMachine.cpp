@@ -9,6 +9,44 @@ namespace finiteStateMachine
   bool teachDone;
   static bool freiStart;
   static unsigned long highStart;
+  static bool teachRunning;          // TEACH läuft (Zeitmessung gestartet)
+  static unsigned long teachStartMs; // Startzeit des laufenden TEACH
+  static unsigned long teachDurationMs;
+  static int backoffCount;
+  static bool zeroValid;             // alter Nullpunkt noch gültig -> Abweichung messbar
+  static bool offsetValid;
+  static long zeroOffset;            // Abweichung des neuen zum alten Nullpunkt in Schritten
+
+  // Lichtschranke stabil HIGH (TEACH_DEBOUNCE_MS)?
+  static bool lichtschrankeStable()
+  {
+    if (digitalRead(LICHTSCHRANKE) != HIGH)
+    {
+      highStart = 0;
+      return false;
+    }
+    if (highStart == 0)
+    {
+      highStart = millis();
+    }
+    return millis() - highStart >= TEACH_DEBOUNCE_MS;
+  }
+
+  // Jeder Ausstieg aus dem TEACH: Benutzerwerte wiederherstellen
+  static void endTeach()
+  {
+    stepperControl::restoreUserMotionProfile();
+    teachRunning = false;
+  }
+
+  static void abortTeach(const char* reason)
+  {
+    stepperControl::stopNow();
+    endTeach();
+    Serial.print("❌ TEACH abgebrochen: ");
+    Serial.println(reason);
+    sysState = SYS_IDLE;
+  }
 
   void setup() 
   {
@@ -16,6 +54,13 @@ namespace finiteStateMachine
     teachDone = false; // Teach-Status initialisieren
     freiStart = false; // ob der Frei-Fahrmodus bereits gestartet wurde
     highStart = 0; // zeit in der die Lichtschranke HIGH ist
+    teachRunning = false;
+    teachStartMs = 0;
+    teachDurationMs = 0;
+    backoffCount = 0;
+    zeroValid = false;
+    offsetValid = false;
+    zeroOffset = 0;
   }
   
   void update() 
@@ -31,15 +76,16 @@ namespace finiteStateMachine
             if (!freiStart)
               {
                 Serial.println("🚀 Frei fahren...");
-                stepperControl::moveToRelative(200); // Move slightly to the right to clear the sensor
+                stepperControl::moveBy(200); // Move slightly to the right to clear the sensor
                 freiStart = true;
                 sysState = SYS_TEACH_FREI;
               }
           }
         else
           {
-            Serial.println("🚀 Teach normal...");
-            stepperControl::moveToRelative(5000); // Move far to the right
+            Serial.println("🚀 Teach schnell...");
+            highStart = 0;
+            stepperControl::moveBy(TEACH_SEARCH_STEPS); // Move far to the right
             sysState = SYS_TEACH_RECHTS;
           }
         break;
@@ -54,33 +100,84 @@ namespace finiteStateMachine
         break;
       
       case SYS_TEACH_RECHTS:
-        static unsigned long highLicht = 0;
-                  
-        if (digitalRead(LICHTSCHRANKE) == HIGH)
-        {
-          if (highLicht == 0)
-           {
-              highLicht = millis(); // remember start time
-           }
-          else if (millis() - highLicht > 50)
-            { //50ms stable HIGH
-            stepperControl::stop();
-            stepperControl::setCurrentPosition(0);
+        // Phase 1: schnelle Suche, bei Lichtschranke sofort stoppen und kurz zurück
+        if (lichtschrankeStable())
+          {
+            stepperControl::stopNow();
+            Serial.println("🐢 Lichtschranke erreicht, Feinsuche...");
+            backoffCount = 0;
+            stepperControl::moveBy(-TEACH_BACKOFF_STEPS);
+            sysState = SYS_TEACH_ZURUECK;
+          }
+        else if (stepperControl::isMoveComplete())
+          {
+            abortTeach("Lichtschranke nicht gefunden");
+          }
+        break;
+
+      case SYS_TEACH_ZURUECK:
+        if (stepperControl::isMoveComplete())
+          {
+            if (digitalRead(LICHTSCHRANKE) == HIGH)
+              {
+                if (++backoffCount >= TEACH_MAX_BACKOFFS)
+                  {
+                    abortTeach("Lichtschranke wird nicht frei");
+                    break;
+                  }
+                stepperControl::moveBy(-TEACH_BACKOFF_STEPS); // noch nicht frei, weiter zurück
+              }
+            else
+              {
+                // Phase 2: langsam über die Kante fahren
+                highStart = 0;
+                stepperControl::applyMotionProfile(TEACH_SLOW_SPEED, TEACH_ACCELERATION);
+                stepperControl::moveBy(3 * TEACH_BACKOFF_STEPS * (backoffCount + 1));
+                sysState = SYS_TEACH_FEIN;
+              }
+          }
+        break;
+
+      case SYS_TEACH_FEIN:
+        if (lichtschrankeStable())
+          {
+            stepperControl::stopNow();
+            // Abweichung zum alten Nullpunkt, normiert auf -MAX_STEP/2 .. MAX_STEP/2
+            offsetValid = zeroValid;
+            if (zeroValid)
+              {
+                zeroOffset = (stepperControl::getCurrentPosition() + TEACH_ZERO_OFFSET) % MAX_STEP;
+                if (zeroOffset < 0) zeroOffset += MAX_STEP;
+                if (zeroOffset >= MAX_STEP / 2) zeroOffset -= MAX_STEP;
+              }
+            stepperControl::setCurrentPosition(-TEACH_ZERO_OFFSET); // gleicher Nullpunkt wie der alte TEACH
+            endTeach();
+            zeroValid = true;
+            teachDurationMs = millis() - teachStartMs;
             Serial.println("✅ Nullpunkt gesetzt");
-            sysState = SYS_TEACH_DONE;
-            }
-        }
-        else
-        {
-          highLicht = 0; // reset if LOW
-        }
+            stepperControl::moveToRelative(0); // auf den Nullpunkt fahren, danach SYS_TEACH_DONE
+            sysState = SYS_MOVE_TO_POS;
+          }
+        else if (stepperControl::isMoveComplete())
+          {
+            abortTeach("Lichtschranke bei Feinsuche nicht gefunden");
+          }
         break;
         
       case SYS_TEACH_DONE:
       if(!teachDone) // nur wenn TEACH noch nicht als done markiert ist
         {
           teachDone = true;
-          Serial.println("TEACH ist fertig!"); 
+          Serial.print("TEACH ist fertig! Dauer: ");
+          Serial.print(teachDurationMs);
+          Serial.print(" ms");
+          if (offsetValid)
+            {
+              Serial.print(", Abweichung: ");
+              Serial.print(zeroOffset);
+              Serial.print(" Schritte");
+            }
+          Serial.println();
         }
         sysState = SYS_IDLE;
       break;
@@ -103,6 +200,7 @@ namespace finiteStateMachine
       
       case SYS_MANUAL_MODE:
         setTeachDone(false); // Teach muss neu gemacht werden
+        invalidateZeroReference(); // Motor kann von Hand verdreht werden
         setState(SYS_IDLE); // zurück zu idle wechseln
         break;
     }
@@ -114,6 +212,10 @@ namespace finiteStateMachine
     switch (sysState) {
         case SYS_IDLE: Serial.println("SYS_IDLE"); break;
         case SYS_TEACH_START: Serial.println("SYS_TEACH"); break;
+        case SYS_TEACH_RECHTS: Serial.println("SYS_TEACH_RECHTS"); break;
+        case SYS_TEACH_FREI: Serial.println("SYS_TEACH_FREI"); break;
+        case SYS_TEACH_ZURUECK: Serial.println("SYS_TEACH_ZURUECK"); break;
+        case SYS_TEACH_FEIN: Serial.println("SYS_TEACH_FEIN"); break;
         case SYS_TEACH_DONE: Serial.println("SYS_TEACH_DONE"); break;
         case SYS_MOVE_TO_POS: Serial.println("SYS_MOVE_TO_POS"); break;
         case SYS_LASER_ACTIVE: Serial.println("SYS_LASER_ACTIVE"); break;
@@ -123,9 +225,36 @@ namespace finiteStateMachine
   
   SystemState getState() { return sysState; }
   
-  void setState(SystemState newState) { sysState = newState; }
+  void setState(SystemState newState) 
+  { 
+    // Zustandswechsel von aussen (z.B. CMD:LASER_stop, CMD:MANUALLY) unterbricht einen laufenden TEACH
+    if (teachRunning)
+      {
+        stepperControl::stopNow();
+        endTeach();
+        Serial.println("⚠️ TEACH unterbrochen.");
+      }
+    sysState = newState; 
+  }
+
+  void startTeach()
+  {
+    teachRunning = true;
+    teachStartMs = millis();
+    teachDone = false; // Nullpunkt ist erst nach der Feinsuche wieder gültig
+    freiStart = false;
+    stepperControl::resetMoveSource(); // TEACH endet über SYS_MOVE_TO_POS, kein altes OK:GOTO/OK:LOAD melden
+    stepperControl::applyMotionProfile(TEACH_FAST_SPEED, TEACH_ACCELERATION);
+    sysState = SYS_TEACH_START;
+  }
   
   bool isTeachDone() { return teachDone; }
 
   void setTeachDone(bool done) { teachDone = done; }
+
+  void invalidateZeroReference() 
+  { 
+    zeroValid = false; 
+    offsetValid = false; 
+  }
 }
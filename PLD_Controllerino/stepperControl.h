@@ -21,7 +21,12 @@ namespace stepperControl
   void setAcceleration(float accel);
   void moveToAbsolute(long position);
   void moveToRelative(long distance);
+  void moveBy(long steps);
   void stop();
+  void stopNow();
+  long getCurrentPosition();
+  void applyMotionProfile(float speed, float accel);
+  void restoreUserMotionProfile();
   void setCurrentPosition(long position);
   bool isMoveComplete();
   int getNormalizedPosition();